@@ -66,3 +66,34 @@ class MsgPackSerializersTests(unittest.TestCase):
         encode_data = self.msgpack_serializer.dumps(obj)
         decode_data = self.msgpack_serializer.loads(encode_data)
         self.assertDictEqual(obj, decode_data)
+
+    def test_loads_many(self):
+        objs = [{"data": i, "value": i + 10.5} for i in range(10)]
+        encode_data = [self.msgpack_serializer.dumps(obj) for obj in objs]
+        decode_data = self.msgpack_serializer.loads_many(encode_data)
+        self.assertListEqual(objs, decode_data)
+
+    def test_loads_many_with_datetime(self):
+        objs = [{"data": datetime.datetime.now()},
+                {"data": datetime.date.today()}]
+        encode_data = [self.msgpack_serializer.dumps(obj) for obj in objs]
+        decode_data = self.msgpack_serializer.loads_many(encode_data)
+        self.assertListEqual(objs, decode_data)
+
+
+class StructFloatSerializerTests(unittest.TestCase):
+    def setUp(self):
+        self.struct_serializer = serializers.StructFloatSerializer()
+
+    def test_loads_and_dumps(self):
+        obj = [1.5, -3.25, 1526611599.240008]
+        encode_data = self.struct_serializer.dumps(obj)
+        self.assertEqual(len(encode_data), 8 * len(obj))
+        decode_data = self.struct_serializer.loads(encode_data)
+        self.assertListEqual(obj, decode_data)
+
+    def test_loads_many(self):
+        objs = [[float(i), i + 0.5] for i in range(10)]
+        encode_data = [self.struct_serializer.dumps(obj) for obj in objs]
+        decode_data = self.struct_serializer.loads_many(encode_data)
+        self.assertListEqual(objs, decode_data)
@@ -44,6 +44,16 @@ class RedisSimpleTSTest(unittest.TestCase, Mixin):
 
             self.assertListEqual(data_list, result)
 
+    def test_remove_many_parallel(self):
+
+        data_list = self.generate_data(10)
+        keys = self.prepare_many_data(data_list)
+
+        self.time_series.remove_many(keys, parallelism=4)
+
+        for key in keys:
+            self.assertFalse(self.time_series.exists(key))
+
     def test_get_max_timestamp(self):
         data_list = self.generate_data(10)
         key = "APPL:SECOND:5"
@@ -59,3 +69,45 @@ class RedisSimpleTSTest(unittest.TestCase, Mixin):
         # data_list.append((timestamp, {"value": i}))
         min_value = min(data_list, key=lambda x: x[1]["value"])
         self.assertEqual(min_value, self.time_series.min_timestamp(key))
+
+    def test_iter_slice(self):
+        data_list = self.generate_data(10)
+        key = "APPL:SECOND:5"
+        self.time_series.add_many(key, data_list)
+
+        results = []
+        for chunk in self.time_series.iter_slice(key, chunks_size=3):
+            chunk = list(chunk)
+            self.assertLessEqual(len(chunk), 3)
+            results.extend(chunk)
+
+        self.assertListEqual(data_list, results)
+
+    def test_iter_slice_with_limit(self):
+        data_list = self.generate_data(10)
+        key = "APPL:SECOND:5"
+        self.time_series.add_many(key, data_list)
+
+        results = []
+        for chunk in self.time_series.iter_slice(key, limit=5, chunks_size=2):
+            results.extend(chunk)
+
+        self.assertListEqual(data_list[:5], results)
+
+    def test_add_many_auto_chunks_size(self):
+        data_list = self.generate_data(10)
+        key = "APPL:SECOND:5"
+        self.time_series.add_many(key, data_list, chunks_size=None)
+
+        self.assertListEqual(data_list, self.time_series.get_slice(key))
+
+    def test_iter_slice_desc(self):
+        data_list = self.generate_data(10)
+        key = "APPL:SECOND:5"
+        self.time_series.add_many(key, data_list)
+
+        results = []
+        for chunk in self.time_series.iter_slice(key, chunks_size=4, asc=False):
+            results.extend(chunk)
+
+        self.assertListEqual(list(reversed(data_list)), results)
@@ -38,11 +38,24 @@ class ChunksTest(unittest.TestCase):
         self.assertTrue(np.array_equal(array_2, result_array_2))
 
         array_rand_2 = np.random.rand(5, 2)
-        array_3, array_4 = np.array_split(array_rand_2, 2)
+        array_3, array_4, array_5 = np.array_split(array_rand_2, 3)
 
-        result_array_3, result_array_4 = list(chunks_np_or_pd_array(array_rand_2, 2))
+        result_array_3, result_array_4, result_array_5 = list(chunks_np_or_pd_array(array_rand_2, 2))
         self.assertTrue(np.array_equal(array_3, result_array_3))
         self.assertTrue(np.array_equal(array_4, result_array_4))
+        self.assertTrue(np.array_equal(array_5, result_array_5))
+
+    def test_chunks_numpy_max_size(self):
+        array_rand = np.random.rand(5000, 2)
+
+        for chunk in chunks_np_or_pd_array(array_rand, 2000):
+            self.assertLessEqual(chunk.shape[0], 2000)
+
+    def test_chunks_numpy_return_views(self):
+        array_rand = np.random.rand(100, 2)
+
+        for chunk in chunks_np_or_pd_array(array_rand, 10):
+            self.assertIs(chunk.base, array_rand)
 
     def test_check_timestamp_repeat(self):
         now = datetime.datetime.now()
@@ -2,6 +2,7 @@
 import abc
 import datetime
 import decimal
+import struct
 
 import msgpack
 from dateutil import parser
@@ -29,6 +30,15 @@ class BaseSerializer(abc.ABC):
         """
         raise NotImplementedError()
 
+    def loads_many(self, iterable, *args, **kwargs):
+        """
+        Deserialize a batch of serialized payloads,
+        subclasses may override it with a faster batched implementation.
+        :param iterable: iterable of serialized payloads
+        :return: list
+        """
+        return [self.loads(data, *args, **kwargs) for data in iterable]
+
 
 class MsgPackDecoder(object):
     """
@@ -105,6 +115,47 @@ class MsgPackSerializer(BaseSerializer):
         """
         return msgpack.packb(data, default=MsgPackEncoder().encode, **kwargs)
 
+    def loads_many(self, iterable, *args, **kwargs):
+        """
+        deserializer a batch of message-pack payloads,
+        feeds the concatenated buffer to one streaming unpacker,
+        so the whole batch is decoded in C instead of calling
+        unpackb once per payload
+        :param iterable: iterable of bytes
+        :return: list
+        """
+        unpacker = msgpack.Unpacker(raw=False, object_hook=MsgPackDecoder().decode, **kwargs)
+        unpacker.feed(b"".join(iterable))
+        return list(unpacker)
+
+
+class StructFloatSerializer(BaseSerializer):
+    """
+    struct serializer for flat float rows
+
+    packs the values as little-endian doubles with the struct module,
+    8 bytes per column and no per-value python object churn on the
+    decode path, the row width is recovered from the payload length.
+    only use it when every stored value is a float.
+    """
+
+    def dumps(self, data, *args, **kwargs):
+        """
+        serializer a flat sequence of floats to packed doubles
+        :param data: iterable of floats
+        :return: bytes
+        """
+        values = list(data)
+        return struct.pack("<%dd" % len(values), *values)
+
+    def loads(self, data, *args, **kwargs):
+        """
+        deserializer packed doubles back to a list of floats
+        :param data: bytes
+        :return: list
+        """
+        return list(struct.unpack("<%dd" % (len(data) // 8), data))
+
 
 class DumpySerializer(BaseSerializer):
     """
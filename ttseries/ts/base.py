@@ -36,6 +36,28 @@ class RedisTSBase(object):
     # todo support parllizem and multi threading
     # todo implement auto moving windows
 
+    # target bytes of serialized data per pipeline flush, used to pick
+    # a chunk size when callers don't provide one, tune it for the
+    # network bandwidth-delay product between client and redis
+    pipeline_bytes_target = 1 << 20
+
+    # length-capped insert: skip an existing timestamp, trim the set
+    # back under the max length and insert, in one atomic server-side
+    # call, so concurrent processes can't race the length check
+    # against the ZADD or leave the set over the cap
+    _capped_add_lua_script = """
+local existed = redis.call('ZCOUNT', KEYS[1], ARGV[1], ARGV[1])
+if existed > 0 then
+    return 0
+end
+local total = redis.call('ZCARD', KEYS[1])
+local max_length = tonumber(ARGV[3])
+if total >= max_length then
+    redis.call('ZREMRANGEBYRANK', KEYS[1], 0, total - max_length)
+end
+return redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+"""
+
     def __init__(self, redis_client, max_length=100000, transaction=True,
                  serializer_cls=serializers.MsgPackSerializer):
         """
@@ -48,6 +70,7 @@ class RedisTSBase(object):
         self.max_length = max_length
         self.transaction = transaction
         self._lock = threading.RLock()
+        self._validated_keys = set()
 
         if issubclass(serializer_cls, serializers.BaseSerializer):
             self._serializer = serializer_cls()
@@ -64,6 +87,32 @@ class RedisTSBase(object):
         """
         return self._redis_client
 
+    @property
+    @functools.lru_cache(maxsize=4096)
+    def _capped_add(self):
+        """
+        :return: registered redis lua script
+        """
+        return self.client.register_script(self._capped_add_lua_script)
+
+    @property
+    @functools.lru_cache(maxsize=4096)
+    def _delete_command(self):
+        """
+        UNLINK (redis >= 4.0) reclaims the memory of large keys on a
+        background thread instead of stalling the redis main thread,
+        probe the server version once and fall back to DEL on older servers
+        or on servers which don't expose INFO.
+        :return: bound redis command
+        """
+        try:
+            version = self.client.info("server").get("redis_version", "0")
+        except redis.exceptions.ResponseError:
+            return self.client.delete
+        if int(version.split(".")[0]) >= 4:
+            return self.client.unlink
+        return self.client.delete
+
     @contextlib.contextmanager
     def _pipe_acquire(self):
         """
@@ -172,13 +221,32 @@ class RedisTSBase(object):
                 finally:
                     pipe.reset()
 
+    def _auto_chunks_size(self, serialized_samples):
+        """
+        estimate a chunk size from sampled serialized payloads, so each
+        pipeline flush carries around pipeline_bytes_target bytes
+        :param serialized_samples: list, serialized payload samples
+        :return: int
+        """
+        if serialized_samples:
+            avg_size = sum(map(len, serialized_samples)) / len(serialized_samples)
+        else:
+            avg_size = 1
+        return max(500, min(50000, int(self.pipeline_bytes_target / max(avg_size, 1))))
+
     def _validate_key(self, name):
         """
-        validate redis key can't contains specific names
+        validate redis key can't contains specific names,
+        keys already validated are remembered, so repeat writes to the
+        same key only pay one set lookup
         :param name:
         """
+        if name in self._validated_keys:
+            return
         if ":HASH" in name or ":ID" in name:
             raise RedisTimeSeriesError("Key can't contains `:HASH`, `:ID` values.")
+        if len(self._validated_keys) < 4096:
+            self._validated_keys.add(name)
 
     def _timestamp_exist(self, name, array):
         """
@@ -221,11 +289,13 @@ class RedisTSBase(object):
             array_data = array_data[array_length - self.max_length:]
         return array_data
 
-    def _add_many_validate_mixin(self, name, timestamp_pairs):
+    def _add_many_validate_mixin(self, name, timestamp_pairs, skip_validation=False):
         """
         validate keys
         trim the array with max length
         check array timestamp repeated
+        :param skip_validation: bool, skip the duplicated-timestamp checks,
+                                for callers that guarantee unique timestamps
         :return:
         """
         self._validate_key(name)
@@ -233,10 +303,11 @@ class RedisTSBase(object):
         timestamp_pairs = sorted(timestamp_pairs, key=itemgetter(0))
         # auto trim timestamps
         timestamp_pairs = self._auto_trim_array(name, timestamp_pairs)
-        # check timestamp repeated
-        ttseries.utils.check_array_repeated(timestamp_pairs)
-        # validate timestamp exist
-        self._timestamp_exist(name, timestamp_pairs)
+        if not skip_validation:
+            # check timestamp repeated
+            ttseries.utils.check_array_repeated(timestamp_pairs)
+            # validate timestamp exist
+            self._timestamp_exist(name, timestamp_pairs)
 
         return timestamp_pairs
 
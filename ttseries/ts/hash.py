@@ -68,14 +68,22 @@ class RedisHashTimeSeries(RedisTSBase):
         incr_key = self.incr_format.format(key=name)  # APPL:SECOND:ID
         hash_key = self.hash_format.format(key=name)  # APPL:second:HASH
 
-        if not self.exist_timestamp(name, timestamp):
+        # probe the timestamp existence and the current length in one
+        # round-trip, ZADD NX can't enforce the timestamp uniqueness here
+        # because the sorted set member is the auto-increase id
+        with self.client.pipeline(transaction=False) as pipe:
+            pipe.zcount(name, min=timestamp, max=timestamp)
+            pipe.zcard(name)
+            exist_count, current_length = pipe.execute()
+
+        if not exist_count:
 
             dumps_data = self._serializer.dumps(data)
 
             key_id = self.client.incr(incr_key)  # int, key id start with 1
             # key id start with 1,2,3,4,5,6...
 
-            if self.length(name) == self.max_length:
+            if current_length == self.max_length:
                 self._auto_trim(name, key_id, hash_key)
 
             dumps_dict = {key_id: dumps_data}  # { 1: values}
@@ -123,7 +131,7 @@ class RedisHashTimeSeries(RedisTSBase):
 
         else:
             # redis delete command
-            self.client.delete(name, incr_key, hash_key)
+            self._delete_command(name, incr_key, hash_key)
 
     def remove_many(self, names, start_timestamp=None, end_timestamp=None):
         """
@@ -147,7 +155,7 @@ class RedisHashTimeSeries(RedisTSBase):
                 incr_chunks = map(lambda x: self.incr_format.format(key=x), chunk_keys)
                 hash_chunks = map(lambda x: self.hash_format.format(key=x), chunk_keys)
                 del_items = itertools.chain(chunk_keys, incr_chunks, hash_chunks)
-                self.client.delete(*del_items)
+                self._delete_command(*del_items)
 
     def trim(self, name, length: int):
         """
@@ -197,21 +205,23 @@ class RedisHashTimeSeries(RedisTSBase):
         if results_ids:
             ids, timestamps = list(itertools.zip_longest(*results_ids))
             values = self.client.hmget(hash_key, *ids)
-            iter_dumps = map(self._serializer.loads, values)
-            return list(itertools.zip_longest(timestamps, iter_dumps))
+            return list(zip(timestamps, self._serializer.loads_many(values)))
 
-    def add_many(self, name, array: list, chunks_size=2000):
+    def add_many(self, name, array: list, chunks_size=2000, skip_validation=False):
         """
         add large amount of data into redis sorted sets
         :param name: redis key
         :param array: data pairs, [("timestamp",data)...]
         :param chunks_size: split data into chunk, optimize for redis pipeline
+        :param skip_validation: bool, skip the duplicated-timestamp checks,
+                                for callers that guarantee unique timestamps
         """
 
         incr_key = self.incr_format.format(key=name)
         hash_key = self.hash_format.format(key=name)
 
-        timestamp_pairs = self._add_many_validate_mixin(name, array)
+        timestamp_pairs = self._add_many_validate_mixin(name, array,
+                                                        skip_validation=skip_validation)
 
         chunks_data = ttseries.utils.chunks(timestamp_pairs, chunks_size)
         for chunks in chunks_data:
@@ -224,15 +234,14 @@ class RedisHashTimeSeries(RedisTSBase):
 
             ids_range = range(int(start_id), int(end_id))
 
-            dumps_results = itertools.starmap(lambda timestamp, data:
-                                              (timestamp, self._serializer.dumps(data)), chunks)
-
-            # [(("timestamp",data),id),...]
-            mix_data = itertools.zip_longest(dumps_results, ids_range)
-            mix_data = list(mix_data)
-
-            ids_values = {item[1]: item[0][1] for item in mix_data}
-            timestamp_ids = {item[1]: item[0][0] for item in mix_data}
+            # build both mappings in one pass over the chunk instead of
+            # a starmap pass, a zip pass and two dict comprehensions
+            dumps = self._serializer.dumps
+            ids_values = {}
+            timestamp_ids = {}
+            for key_id, (timestamp, data) in zip(ids_range, chunks):
+                ids_values[key_id] = dumps(data)
+                timestamp_ids[key_id] = timestamp
 
             def pipe_func(_pipe):
                 _pipe.zadd(name, timestamp_ids)
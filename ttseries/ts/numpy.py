@@ -1,10 +1,10 @@
 # encoding:utf-8
-import copy
 import itertools
 
 import numpy as np
 
 import ttseries.utils
+from ttseries import serializers
 from ttseries.exceptions import RedisTimeSeriesError
 from .sample import RedisSampleTimeSeries
 
@@ -40,6 +40,10 @@ class RedisNumpyTimeSeries(RedisSampleTimeSeries):
 
             self.names = list(self.dtype.names)
             self.timestamp_name_index = self.names.index(timestamp_column_name)
+            # payload field names resolved once, instead of rebuilding
+            # them for every chunk in add_many
+            self.data_names = [name for name in self.names
+                               if name != timestamp_column_name]
         else:
             self.dtype = None
 
@@ -98,7 +102,8 @@ class RedisNumpyTimeSeries(RedisSampleTimeSeries):
             if duplicated.size > 0:
                 raise RedisTimeSeriesError("add duplicated timestamp into redis -> timestamp:")
 
-    def add_many(self, name, array: np.ndarray, chunks_size=2000):
+    def add_many(self, name, array: np.ndarray, chunks_size=2000,
+                 skip_validation=False):
         """
         add large amount of numpy array into redis
         >>>[[timestamp,"a","c"],
@@ -106,48 +111,65 @@ class RedisNumpyTimeSeries(RedisSampleTimeSeries):
         >>> [timestamp,"c","a"],...]
         :param name: redis key
         :param array: numpy.ndarray
-        :param chunks_size: int, split data into chunk, optimize for redis pipeline
+        :param chunks_size: int, split data into chunk, optimize for redis pipeline,
+                            if None, sized from sampled payload bytes to hit
+                            pipeline_bytes_target per flush
+        :param skip_validation: bool, skip the duplicated-timestamp checks,
+                                for callers that guarantee unique timestamps
         """
         self._validate_key(name)
 
         array = self._validate_duplicated_index(array)
         # auto trim timestamps
         array = self._auto_trim_array(name, array)
-        # validate timestamp exist
-        self._timestamp_exist(name, array)
+        if not skip_validation:
+            # validate timestamp exist
+            self._timestamp_exist(name, array)
 
-        for chunk_array in ttseries.utils.chunks_np_or_pd_array(array, chunks_size):
+        dumps = self._serializer.dumps
 
+        if chunks_size is None:
             if self.dtype:
-                timestamp_index = self.names.index(self.timestamp_column_name)
-                names = copy.deepcopy(self.names)
-                names.pop(self.timestamp_column_index)
+                samples = [dumps(tuple(data.item() for data in row[self.data_names]))
+                           for row in array[:16]]
             else:
-                timestamp_index = self.timestamp_column_index
+                samples = [dumps(row.tolist()) for row in
+                           np.delete(array[:16], self.timestamp_column_index, axis=1)]
+            chunks_size = self._auto_chunks_size(samples)
+        for chunk_array in ttseries.utils.chunks_np_or_pd_array(array, chunks_size):
 
             result = {}
 
-            for row in chunk_array:
-
-                timestamp = row[timestamp_index]
+            if self.dtype:
+                timestamp_index = self.timestamp_name_index
+                names = self.data_names
 
-                if self.dtype:
-                    list_data = row[names]
+                for row in chunk_array:
+                    timestamp = row[timestamp_index]
+                    list_data = tuple(data.item() for data in row[names])
+                    result[dumps(list_data)] = timestamp
+            else:
+                # batch the rows at once instead of walking the array
+                # row by row in python
+                timestamps = chunk_array[:, self.timestamp_column_index].astype("float64").tolist()
+                if self.timestamp_column_index == 0:
+                    # a plain slice keeps the payload in one contiguous
+                    # buffer, so the per-row tolist() below runs over
+                    # c-ordered memory instead of a strided view
+                    payload = np.ascontiguousarray(chunk_array[:, 1:])
                 else:
-                    part_row = row[:timestamp_index]
-                    rest_row = row[timestamp_index + 1:]
-                    if part_row.size == 0:
-                        list_data = rest_row
-                    elif rest_row.size == 0:
-                        list_data = part_row
-                    else:
-                        list_data = rest_row + part_row
-
-                list_data = tuple(data.item() for data in list_data)
-
-                data = self._serializer.dumps(list_data)
-
-                result[data] = timestamp
+                    payload = np.delete(chunk_array, self.timestamp_column_index, axis=1)
+
+                if isinstance(self._serializer, serializers.StructFloatSerializer) \
+                        and payload.dtype.kind == "f":
+                    # pack the row buffer directly, skipping the
+                    # per-row tolist() and the struct call
+                    payload = payload.astype("<f8", copy=False)
+                    for timestamp, row in zip(timestamps, payload):
+                        result[row.tobytes()] = timestamp
+                else:
+                    for timestamp, row in zip(timestamps, payload):
+                        result[dumps(row.tolist())] = timestamp
 
             def pipe_func(_pipe):
                 _pipe.zadd(name, result)
@@ -208,8 +230,10 @@ class RedisNumpyTimeSeries(RedisSampleTimeSeries):
         if results:
             # [(b'\x81\xa5value\x00', 1526008483.331131),...]
 
+            loads = self._serializer.loads
+
             def apply_numpy_index(serializer_data, timestamp):
-                data = self._serializer.loads(serializer_data)
+                data = loads(serializer_data)
                 data.insert(column_index, timestamp)
                 return tuple(data)
 
@@ -1,5 +1,4 @@
 # encoding:utf-8
-import itertools
 from datetime import datetime
 
 import numpy
@@ -96,13 +95,15 @@ class RedisPandasTimeSeries(RedisSampleTimeSeries):
             array_data = array_data.iloc[length - self.max_length:]
         return array_data
 
-    def add_many(self, name, data_frame, chunks_size=2000):
+    def add_many(self, name, data_frame, chunks_size=2000, skip_validation=False):
         """
         add large amount of pandas.DataFrame, the dataframe index type should be the pandas.DateTimeIndex.
         or a kind of timestamp index.
         :param name: redis key
         :param data_frame: pandas.DataFrame
         :param chunks_size: int, split data into chunk, optimize for redis pipeline
+        :param skip_validation: bool, skip the duplicated-timestamp checks,
+                                for callers that guarantee unique timestamps
         """
         self._validate_key(name)
         if not isinstance(data_frame, pd.DataFrame):
@@ -111,19 +112,22 @@ class RedisPandasTimeSeries(RedisSampleTimeSeries):
             raise TypeError("DataFrame index must be pandas.DateTimeIndex type")
         data_frame = data_frame.sort_index()
 
-        # check timestamp repeated
-        self._validate_append_data(data_frame)
+        if not skip_validation:
+            # check timestamp repeated
+            self._validate_append_data(data_frame)
 
         # auto trim timestamps
         array = self._auto_trim_array(name, data_frame)
-        # validate timestamp exist
-        self._timestamp_exist(name, array)
+        if not skip_validation:
+            # validate timestamp exist
+            self._timestamp_exist(name, array)
+        dumps = self._serializer.dumps
         for chunk_array in ttseries.utils.chunks_np_or_pd_array(array, chunks_size):
             # To preserve dtypes while iterating over the rows, it is better
             # to use :meth:`itertuples` which returns namedtuples of the values
             # and which is generally faster than ``iterrows``
 
-            data_pairs = {self._serializer.dumps(row[1:]): row[0].to_pydatetime().timestamp()
+            data_pairs = {dumps(row[1:]): row[0].to_pydatetime().timestamp()
                           for row in chunk_array.itertuples()}
 
             def pipe_func(_pipe):
@@ -133,9 +137,12 @@ class RedisPandasTimeSeries(RedisSampleTimeSeries):
 
     def add(self, name, series):
         """
+        add one pandas.Series into redis,
+        the existence check, the max length trim and the insert run
+        as one lua script instead of separate round-trips.
         :param name: redis key
         :param series: pandas.Series
-        :return: bool
+        :return: int, 0 if the timestamp already exists
         """
         self._validate_key(name)
 
@@ -144,14 +151,9 @@ class RedisPandasTimeSeries(RedisSampleTimeSeries):
             series_time = series.name.to_pydatetime()
             timestamp = series_time.timestamp()
 
-            with self._lock:
-                if not self.exist_timestamp(name, timestamp):
-                    values = series.tolist()
-                    data = self._serializer.dumps(values)
-                    if self.length(name) == self.max_length:
-                        # todo use 5.0 BZPOPMIN
-                        self.client.zremrangebyrank(name, min=0, max=0)
-                    return self.client.zadd(name, {data: timestamp})
+            data = self._serializer.dumps(series.tolist())
+            return self._capped_add(keys=[name],
+                                    args=[timestamp, data, self.max_length])
         else:
             raise RedisTimeSeriesError("Please check series Type or "
                                        "series name value is not pandas.DateTimeIndex type")
@@ -199,11 +201,9 @@ class RedisPandasTimeSeries(RedisSampleTimeSeries):
 
         if results:
             # [(b'\x81\xa5value\x00', 1526008483.331131),...]
-
-            data = list(itertools.starmap(lambda serializer, timestamp:
-                                          [datetime.fromtimestamp(timestamp)] +
-                                          self._serializer.loads(serializer),
-                                          results))
+            loads = self._serializer.loads
+            data = [[datetime.fromtimestamp(timestamp)] + loads(serializer_data)
+                    for serializer_data, timestamp in results]
 
             data_frame = pd.DataFrame.from_records(data, columns=[self.index_name] + self.columns)
             data_frame = data_frame.set_index(self.index_name)
@@ -1,6 +1,7 @@
 # encoding:utf-8
 
-import itertools
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 import ttseries.utils
 from ttseries.ts.base import RedisTSBase
@@ -27,40 +28,78 @@ class RedisSampleTimeSeries(RedisTSBase):
     let's it support some specific patch to full support time-series data.
     """
 
+    # drop the oldest items as the trim length, or drop the whole
+    # key when the trim length covers it, in one atomic call
+    _trim_lua_script = """
+local total = redis.call('ZCARD', KEYS[1])
+local length = tonumber(ARGV[1])
+if total > length and length > 0 then
+    return redis.call('ZREMRANGEBYRANK', KEYS[1], 0, length - 1)
+elseif length >= total then
+    return redis.call('DEL', KEYS[1])
+end
+"""
+
+    @property
+    @functools.lru_cache(maxsize=4096)
+    def _trim_script(self):
+        """
+        :return: registered redis lua script
+        """
+        return self.client.register_script(self._trim_lua_script)
+
     def add(self, name: str, timestamp: float, data):
         """
-        add one times-series data into redis
+        add one times-series data into redis,
+        the existence check, the max length trim and the insert run
+        as one lua script, so only one network round-trip is paid.
         :param name: redis key
         :param timestamp: float
         :param data: obj
-        :return: int
+        :return: int, 0 if the timestamp already exists
         """
         self._validate_key(name)
-        with self._lock:
-            if not self.exist_timestamp(name, timestamp):
-                data = self._serializer.dumps(data)
-                if self.length(name) == self.max_length:
-                    # todo use 5.0 BZPOPMIN
-                    self.client.zremrangebyrank(name, min=0, max=0)
-
-                return self.client.zadd(name, mapping={data: timestamp})
+        data = self._serializer.dumps(data)
+        return self._capped_add(keys=[name],
+                                args=[timestamp, data, self.max_length])
 
-    def add_many(self, name, array: list, chunks_size=2000):
+    def add_many(self, name, array: list, chunks_size=2000, use_transaction=False,
+                 skip_validation=False):
         """
         add large amount of data into redis sorted sets
+
+        appending to the sorted set doesn't read any previous state, so by
+        default each chunk is flushed with a plain pipeline which avoids the
+        WATCH/MULTI/EXEC round-trips per chunk.
         :param name: redis key
         :param array: data pairs, [("timestamp",data)...]
-        :param chunks_size: split data into chunk, optimize for redis pipeline
+        :param chunks_size: split data into chunk, optimize for redis pipeline,
+                            if None, sized from sampled payload bytes to hit
+                            pipeline_bytes_target per flush
+        :param use_transaction: bool, wrap each chunk in a WATCH/MULTI transaction
+        :param skip_validation: bool, skip the duplicated-timestamp checks,
+                                for callers that guarantee unique timestamps
         """
-        timestamp_pairs = self._add_many_validate_mixin(name, array)
+        timestamp_pairs = self._add_many_validate_mixin(name, array,
+                                                        skip_validation=skip_validation)
 
+        dumps = self._serializer.dumps
+
+        if chunks_size is None:
+            samples = [dumps(data) for _, data in timestamp_pairs[:16]]
+            chunks_size = self._auto_chunks_size(samples)
         for item in ttseries.utils.chunks(timestamp_pairs, chunks_size):
-            result_data = {self._serializer.dumps(data): timestamp for timestamp, data in item}
+            result_data = {dumps(data): timestamp for timestamp, data in item}
 
-            def pipe_func(_pipe):
-                _pipe.zadd(name, result_data)
+            if use_transaction:
+                def pipe_func(_pipe):
+                    _pipe.zadd(name, result_data)
 
-            self.transaction_pipe(pipe_func, watch_keys=name)
+                self.transaction_pipe(pipe_func, watch_keys=name)
+            else:
+                with self.client.pipeline(transaction=False) as pipe:
+                    pipe.zadd(name, result_data)
+                    pipe.execute()
 
     def get(self, name: str, timestamp: float):
         """
@@ -84,17 +123,17 @@ class RedisSampleTimeSeries(RedisTSBase):
         :param end_timestamp: end timestamp
         :return: int, the result of the elements removed
         """
-        with self._lock:
-            if start_timestamp or end_timestamp:
-                if start_timestamp is None:
-                    start_timestamp = "-inf"
-                if end_timestamp is None:
-                    end_timestamp = "+inf"
-                return self.client.zremrangebyscore(name, min=start_timestamp, max=end_timestamp)
-            else:
-                return self.client.delete(name)
+        if start_timestamp or end_timestamp:
+            if start_timestamp is None:
+                start_timestamp = "-inf"
+            if end_timestamp is None:
+                end_timestamp = "+inf"
+            return self.client.zremrangebyscore(name, min=start_timestamp, max=end_timestamp)
+        else:
+            return self._delete_command(name)
 
-    def remove_many(self, names, start_timestamp=None, end_timestamp=None):
+    def remove_many(self, names, start_timestamp=None, end_timestamp=None,
+                    parallelism=1):
         """
         remove many keys with timestamp
         ! if only parameter contains names, will directly delete redis key.
@@ -103,33 +142,47 @@ class RedisSampleTimeSeries(RedisTSBase):
         :param names: tuple, redis keys
         :param start_timestamp: float, start timestamp
         :param end_timestamp: float, end timestamp
+        :param parallelism: int, delete chunks over this many worker threads,
+                            each chunk runs on its own pipeline, the redis-py
+                            connection pool is thread safe
         """
         chunks_data = ttseries.utils.chunks(names, 1000)
 
         if start_timestamp or end_timestamp:
-            for chunk_keys in chunks_data:
-                for name in chunk_keys:
-                    self.delete(name, start_timestamp, end_timestamp)
+            if start_timestamp is None:
+                start_timestamp = "-inf"
+            if end_timestamp is None:
+                end_timestamp = "+inf"
+
+            # flush every ZREMRANGEBYSCORE of a chunk in one round-trip
+            # instead of one delete round-trip per key
+            def delete_chunk(chunk_keys):
+                with self.client.pipeline(transaction=False) as pipe:
+                    for name in chunk_keys:
+                        pipe.zremrangebyscore(name, min=start_timestamp,
+                                              max=end_timestamp)
+                    pipe.execute()
+        else:
+            def delete_chunk(chunk_keys):
+                self._delete_command(*chunk_keys)
+
+        if parallelism > 1:
+            with ThreadPoolExecutor(max_workers=parallelism) as executor:
+                list(executor.map(delete_chunk, chunks_data))
         else:
             for chunk_keys in chunks_data:
-                self.client.delete(*chunk_keys)
+                delete_chunk(chunk_keys)
 
     def trim(self, name: str, length: int):
         """
         trim the redis sorted sets as the length of the data.
-        trim the data with timestamp as the asc
+        trim the data with timestamp as the asc,
+        the length check and the removal run as one lua script, so
+        concurrent writers can't race between the check and the trim.
         :param name: redis key
         :param length: int, length
         """
-        current_length = self.length(name)
-
-        with self._lock:
-            if current_length > length > 0:
-                begin = 0  # start with 0 as the first set item
-                end = length - 1
-                self.client.zremrangebyrank(name, min=begin, max=end)
-            elif length >= current_length:
-                self.delete(name)
+        return self._trim_script(keys=[name], args=[length])
 
     def get_slice(self, name, start_timestamp=None,
                   end_timestamp=None, limit=None, asc=True):
@@ -149,9 +202,105 @@ class RedisSampleTimeSeries(RedisTSBase):
 
         if results:
             # [(b'\x81\xa5value\x00', 1526008483.331131),...]
-            return list(itertools.starmap(lambda data, timestamp:
-                                          (timestamp, self._serializer.loads(data)),
-                                          results))
+            values = self._serializer.loads_many(data for data, _ in results)
+            return list(zip((timestamp for _, timestamp in results), values))
+
+    def iter_slice(self, name, start_timestamp=None,
+                   end_timestamp=None, limit=None,
+                   chunks_size=2000, asc=True):
+        """
+        iterate a slice from redis sorted sets in chunks,
+        each chunk is anchored on the last seen score with the redis
+        exclusive `(score` syntax, so paging never re-skips an offset
+        inside the sorted set and no pre-count round-trip is needed.
+        when no timestamp bounds are given the pages walk the set by
+        rank instead, which costs O(log(N) + M) per page.
+
+        :param name: redis key
+        :param start_timestamp: start timestamp
+        :param end_timestamp: end timestamp
+        :param limit: int, limit the length of the result data.
+        :param chunks_size: int, the length of each yielded chunk
+        :param asc: bool, sorted as the timestamp values
+        :return: yield lazy pages of (timestamp,data) pairs
+        """
+        if start_timestamp is None and end_timestamp is None:
+            yield from self._iter_slice_by_rank(name, limit, chunks_size, asc)
+            return
+
+        if asc:
+            zrange_func = self.client.zrangebyscore
+        else:  # desc
+            zrange_func = self.client.zrevrangebyscore
+
+        if start_timestamp is None:
+            start_timestamp = "-inf"
+        if end_timestamp is None:
+            end_timestamp = "+inf"
+
+        loads_many = self._serializer.loads_many
+        remaining = limit
+
+        while remaining is None or remaining > 0:
+            if remaining is None:
+                num = chunks_size
+            else:
+                num = min(chunks_size, remaining)
+
+            results = zrange_func(name, min=start_timestamp,
+                                  max=end_timestamp,
+                                  withscores=True,
+                                  start=0, num=num)
+            if not results:
+                break
+
+            values = loads_many(data for data, _ in results)
+            yield zip((timestamp for _, timestamp in results), values)
+
+            if len(results) < num:
+                break
+            if remaining is not None:
+                remaining -= len(results)
+            # anchor the next page after the last seen timestamp
+            last_timestamp = "(" + repr(results[-1][1])
+            if asc:
+                start_timestamp = last_timestamp
+            else:  # desc
+                end_timestamp = last_timestamp
+
+    def _iter_slice_by_rank(self, name, limit, chunks_size, asc):
+        """
+        page the whole sorted set by rank with ZRANGE/ZREVRANGE,
+        every page costs O(log(N) + M) with no offset to re-skip
+        :param name: redis key
+        :param limit: int, limit the length of the result data.
+        :param chunks_size: int, the length of each yielded chunk
+        :param asc: bool, sorted as the timestamp values
+        :return: yield lazy pages of (timestamp,data) pairs
+        """
+        loads_many = self._serializer.loads_many
+        remaining = limit
+        rank = 0
+
+        while remaining is None or remaining > 0:
+            if remaining is None:
+                num = chunks_size
+            else:
+                num = min(chunks_size, remaining)
+
+            results = self.client.zrange(name, rank, rank + num - 1,
+                                         desc=not asc, withscores=True)
+            if not results:
+                break
+
+            values = loads_many(data for data, _ in results)
+            yield zip((timestamp for _, timestamp in results), values)
+
+            if len(results) < num:
+                break
+            if remaining is not None:
+                remaining -= len(results)
+            rank += len(results)
 
     def iter_keys(self, count=None):
         """
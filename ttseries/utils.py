@@ -1,5 +1,6 @@
 # encoding:utf-8
 import itertools
+import math
 
 import numpy as np
 
@@ -23,14 +24,16 @@ def check_array_repeated(array):
 
 def chunks_np_or_pd_array(array, chunk_size: int = 2000):
     """
-    split numpy array into chunk array
+    split numpy array into chunk array,
+    np.array_split slices the array into views without copying the
+    data, and the ceiling split count keeps every chunk within chunk_size.
     :param array: numpy array
     :param chunk_size: int, split data as the length of chunks
     :return: yield numpy.ndarray
     """
     length = array.shape[0]
     if length > chunk_size:
-        chunk = int(length / chunk_size)
+        chunk = math.ceil(length / chunk_size)
         for item in np.array_split(array, chunk):
             yield item
     else: